@@ -10,6 +10,7 @@ No external libraries required.
 
 from __future__ import annotations
 
+import functools
 import os
 
 # ---------------------------------------------------------------------------
@@ -23,9 +24,27 @@ BOARD_H = 20.0  # mm
 SCALE = 1_000_000
 
 
+_COORD_CACHE: dict[float, str] = {}
+
+
 def coord(mm: float) -> str:
-    """Convert mm to Gerber integer string (FSLAX36Y36)."""
-    return str(round(mm * SCALE))
+    """Convert mm to Gerber integer string (FSLAX36Y36), memoized."""
+    s = _COORD_CACHE.get(mm)
+    if s is None:
+        s = _COORD_CACHE[mm] = str(round(mm * SCALE))
+    return s
+
+
+# (x, y) in mm -> (X string, Y string)
+_XY_STR_CACHE: dict[tuple[float, float], tuple[str, str]] = {}
+
+
+def coord_xy(x: float, y: float) -> tuple[str, str]:
+    """Return the Gerber coordinate strings for a point, memoized."""
+    xy = _XY_STR_CACHE.get((x, y))
+    if xy is None:
+        xy = _XY_STR_CACHE[(x, y)] = (coord(x), coord(y))
+    return xy
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +121,9 @@ APERTURE_DEFS: dict[str, str] = {
     AP_GND_POUR: f"%ADD27R,{BOARD_W - 1.0:.4f}X{BOARD_H - 1.0:.4f}*%",
 }
 
+# Aperture-select line per D-code, built once and reused on every select
+AP_SELECT: dict[str, str] = {ap: f"{ap}*\n" for ap in APERTURE_DEFS}
+
 
 # ---------------------------------------------------------------------------
 # Gerber file helpers
@@ -122,20 +144,67 @@ def gerber_apertures(codes: list[str]) -> str:
     return "\n".join(APERTURE_DEFS[c] for c in codes if c in APERTURE_DEFS) + "\n"
 
 
+# Aperture definition block per layer (static, so rendered once)
+_APS_TOP_CU = gerber_apertures([
+    AP_QFN_VERT, AP_QFN_HORIZ, AP_QFN_EP, AP_0402,
+    AP_TH, AP_VIA, AP_TRACE,
+])
+_APS_BOT_CU = gerber_apertures([AP_GND_POUR, AP_VIA])
+_APS_TOP_MASK = gerber_apertures([
+    AP_SMASK_QFN_V, AP_SMASK_QFN_H, AP_SMASK_EP,
+    AP_SMASK_0402, AP_SMASK_TH, AP_SMASK_VIA,
+])
+_APS_BOT_MASK = gerber_apertures([AP_SMASK_VIA, AP_SMASK_TH])
+_APS_TOP_SILK = gerber_apertures([AP_SILK, AP_PIN1])
+_APS_OUTLINE = gerber_apertures([AP_OUTLINE])
+
+
 def flash(aperture: str, x: float, y: float) -> str:
-    return f"{aperture}*\nX{coord(x)}Y{coord(y)}D03*\n"
+    xs, ys = coord_xy(x, y)
+    return f"{AP_SELECT[aperture]}X{xs}Y{ys}D03*\n"
+
+
+def flash_batch(pts: list[tuple[float, float]]) -> str:
+    """Flash every point with the currently selected aperture."""
+    # One join over cached coordinate strings; no per-point helper call.
+    return "".join([
+        f"X{xs}Y{ys}D03*\n" for xs, ys in (coord_xy(x, y) for x, y in pts)
+    ])
 
 
 def move_to(x: float, y: float) -> str:
-    return f"X{coord(x)}Y{coord(y)}D02*\n"
+    xs, ys = coord_xy(x, y)
+    return f"X{xs}Y{ys}D02*\n"
 
 
 def draw_to(x: float, y: float) -> str:
-    return f"X{coord(x)}Y{coord(y)}D01*\n"
+    xs, ys = coord_xy(x, y)
+    return f"X{xs}Y{ys}D01*\n"
+
+
+def rect_outline(x0: float, y0: float, x1: float, y1: float) -> str:
+    """Closed rectangle with the currently selected aperture."""
+    return (
+        move_to(x0, y0)
+        + draw_to(x1, y0)
+        + draw_to(x1, y1)
+        + draw_to(x0, y1)
+        + draw_to(x0, y0)
+    )
+
+
+def emit_route(route: list[tuple[float, float]]) -> str:
+    """Move to the first vertex, then draw through the rest."""
+    if len(route) < 2:
+        return ""
+    pts = [coord_xy(x, y) for x, y in route]
+    x0, y0 = pts[0]
+    head = f"X{x0}Y{y0}D02*\n"
+    return head + "".join(f"X{xs}Y{ys}D01*\n" for xs, ys in pts[1:])
 
 
 def select_aperture(ap: str) -> str:
-    return f"{ap}*\n"
+    return AP_SELECT[ap]
 
 
 def gerber_footer() -> str:
@@ -154,33 +223,26 @@ PAD_OFFSET = 1.40
 
 def qfn_pads() -> list[tuple[float, float, str, str, int]]:
     """Return [(x, y, copper_aperture, mask_aperture, pin_number)]."""
-    pads: list[tuple[float, float, str, str, int]] = []
-    pin = 1
-    # Bottom side: L->R
-    for i in range(5):
-        x = IC_X + (i - 2) * PITCH
-        y = IC_Y - PAD_OFFSET
-        pads.append((x, y, AP_QFN_VERT, AP_SMASK_QFN_V, pin))
-        pin += 1
-    # Left side: B->T
-    for i in range(5):
-        x = IC_X - PAD_OFFSET
-        y = IC_Y + (i - 2) * PITCH
-        pads.append((x, y, AP_QFN_HORIZ, AP_SMASK_QFN_H, pin))
-        pin += 1
-    # Top side: R->L
-    for i in range(5):
-        x = IC_X - (i - 2) * PITCH
-        y = IC_Y + PAD_OFFSET
-        pads.append((x, y, AP_QFN_VERT, AP_SMASK_QFN_V, pin))
-        pin += 1
-    # Right side: T->B
-    for i in range(5):
-        x = IC_X + PAD_OFFSET
-        y = IC_Y - (i - 2) * PITCH
-        pads.append((x, y, AP_QFN_HORIZ, AP_SMASK_QFN_H, pin))
-        pin += 1
-    return pads
+    offs = [(i - 2) * PITCH for i in range(5)]
+    sides: list[tuple[list[tuple[float, float]], str, str]] = [
+        # Bottom side: L->R
+        ([(IC_X + d, IC_Y - PAD_OFFSET) for d in offs],
+         AP_QFN_VERT, AP_SMASK_QFN_V),
+        # Left side: B->T
+        ([(IC_X - PAD_OFFSET, IC_Y + d) for d in offs],
+         AP_QFN_HORIZ, AP_SMASK_QFN_H),
+        # Top side: R->L
+        ([(IC_X - d, IC_Y + PAD_OFFSET) for d in offs],
+         AP_QFN_VERT, AP_SMASK_QFN_V),
+        # Right side: T->B
+        ([(IC_X + PAD_OFFSET, IC_Y - d) for d in offs],
+         AP_QFN_HORIZ, AP_SMASK_QFN_H),
+    ]
+    flat = [(x, y, cu, mask) for pts, cu, mask in sides for x, y in pts]
+    return [
+        (x, y, cu, mask, pin)
+        for pin, (x, y, cu, mask) in enumerate(flat, start=1)
+    ]
 
 
 QFN = qfn_pads()
@@ -193,24 +255,22 @@ EP_POS = (IC_X, IC_Y)
 P0402_SPAN = 0.70
 
 
-def p0402_pads(
-    cx: float, cy: float, horizontal: bool = True
-) -> tuple[tuple[float, float], tuple[float, float]]:
-    half = P0402_SPAN / 2
-    if horizontal:
-        return ((cx - half, cy), (cx + half, cy))
-    return ((cx, cy - half), (cx, cy + half))
-
-
 C1_CENTER = (7.0, 10.4)
 C2_CENTER = (7.0, 9.0)
 R1_CENTER = (9.2, 7.5)
 R2_CENTER = (10.6, 7.5)
+PASSIVE_CENTERS = [C1_CENTER, C2_CENTER, R1_CENTER, R2_CENTER]
+
+# All passives are horizontal: pad 1 left, pad 2 right of centre.
+# Stored as flat x / y arrays, two entries per component.
+_P0402_HALF = P0402_SPAN / 2
+PASSIVE_PAD_X = [
+    cx + d for cx, _cy in PASSIVE_CENTERS for d in (-_P0402_HALF, _P0402_HALF)
+]
+PASSIVE_PAD_Y = [cy for _cx, cy in PASSIVE_CENTERS for _pad in (1, 2)]
+P0402_PADS = list(zip(PASSIVE_PAD_X, PASSIVE_PAD_Y))
 
-C1_P1, C1_P2 = p0402_pads(*C1_CENTER)
-C2_P1, C2_P2 = p0402_pads(*C2_CENTER)
-R1_P1, R1_P2 = p0402_pads(*R1_CENTER)
-R2_P1, R2_P2 = p0402_pads(*R2_CENTER)
+C1_P1, C1_P2, C2_P1, C2_P2, R1_P1, R1_P2, R2_P1, R2_P2 = P0402_PADS
 
 # 8-pin header J1
 J1_X_START = 1.11
@@ -252,38 +312,192 @@ def manhattan_vert_first(
     return [(x0, y0), (x0, y1), (x1, y1)]
 
 
-TRACES: list[list[tuple[float, float]]] = []
-
-# VCC net
-TRACES.append(manhattan_vert_first(*J1_PINS[0], *C2_P1))
-TRACES.append(manhattan_vert_first(*C2_P1, *C1_P1))
-TRACES.append(manhattan(*C1_P1, *QFN_BY_PIN[18]))
-TRACES.append(manhattan(*R1_P2, *C1_P1))
-TRACES.append(manhattan(*R2_P2, *R1_P2))
+Point = tuple[float, float]
+Route = list[Point]
+
+# Point-to-point connections, grouped by net:
+# (start, end, net, vert_first) where vert_first is the hand-picked default
+NETS: list[tuple[Point, Point, str, bool]] = [
+    # VCC net
+    (J1_PINS[0], C2_P1, "VCC", True),
+    (C2_P1, C1_P1, "VCC", True),
+    (C1_P1, QFN_BY_PIN[18], "VCC", False),
+    (R1_P2, C1_P1, "VCC", False),
+    (R2_P2, R1_P2, "VCC", False),
+    # GND net
+    (J1_PINS[1], C2_P2, "GND", True),
+    (C2_P2, C1_P2, "GND", True),
+    (C1_P2, QFN_BY_PIN[19], "GND", False),
+    (QFN_BY_PIN[19], EP_POS, "GND", False),
+    # SDA net
+    (J1_PINS[2], R1_P1, "SDA", True),
+    (R1_P1, QFN_BY_PIN[9], "SDA", False),
+    # SCL net
+    (J1_PINS[3], R2_P1, "SCL", True),
+    (R2_P1, QFN_BY_PIN[10], "SCL", False),
+    # ENA net
+    (J1_PINS[4], QFN_BY_PIN[11], "ENA", True),
+    # RST_N net
+    (J1_PINS[5], QFN_BY_PIN[14], "RST_N", True),
+    # VIN net
+    (J1_PINS[6], QFN_BY_PIN[12], "VIN", True),
+]
 
-# GND net
-TRACES.append(manhattan_vert_first(*J1_PINS[1], *C2_P2))
-TRACES.append(manhattan_vert_first(*C2_P2, *C1_P2))
-TRACES.append(manhattan(*C1_P2, *QFN_BY_PIN[19]))
-TRACES.append([(QFN_BY_PIN[19][0], QFN_BY_PIN[19][1]),
-               (IC_X, QFN_BY_PIN[19][1]), (IC_X, IC_Y)])
+# Top-copper pads as (x, y, w, h, net); None = unconnected.  TH and via
+# pads are round, approximated by their bounding square.
+QFN_PIN_NETS = {18: "VCC", 19: "GND", 9: "SDA", 10: "SCL",
+                11: "ENA", 14: "RST_N", 12: "VIN"}
+P0402_PAD_NETS = ["VCC", "GND", "VCC", "GND", "SDA", "VCC", "SCL", "VCC"]
+J1_PIN_NETS = ["VCC", "GND", "SDA", "SCL", "ENA", "RST_N", "VIN", None]
+
+PADS: list[tuple[float, float, float, float, str | None]] = [
+    *((x, y, QFN_PAD_W, QFN_PAD_H, QFN_PIN_NETS.get(pin))
+      if ap == AP_QFN_VERT else
+      (x, y, QFN_PAD_H, QFN_PAD_W, QFN_PIN_NETS.get(pin))
+      for x, y, ap, _m, pin in QFN),
+    (*EP_POS, QFN_EP_W, QFN_EP_H, "GND"),
+    *((x, y, P0402_W, P0402_H, net)
+      for (x, y), net in zip(P0402_PADS, P0402_PAD_NETS)),
+    *((x, y, TH_PAD_D, TH_PAD_D, net)
+      for (x, y), net in zip(J1_PINS, J1_PIN_NETS)),
+    *((x, y, VIA_PAD_D, VIA_PAD_D, "GND") for x, y in GND_VIAS),
+]
 
-# SDA net
-TRACES.append(manhattan_vert_first(*J1_PINS[2], *R1_P1))
-TRACES.append(manhattan(*R1_P1, *QFN_BY_PIN[9]))
 
-# SCL net
-TRACES.append(manhattan_vert_first(*J1_PINS[3], *R2_P1))
-TRACES.append(manhattan(*R2_P1, *QFN_BY_PIN[10]))
+def _segment_box(a: Point, b: Point) -> tuple[float, float, float, float]:
+    """Copper footprint of a trace segment: (x0, y0, x1, y1)."""
+    hw = TRACE_W / 2
+    return (min(a[0], b[0]) - hw, min(a[1], b[1]) - hw,
+            max(a[0], b[0]) + hw, max(a[1], b[1]) + hw)
+
+
+def _boxes_overlap(p: tuple[float, float, float, float],
+                   q: tuple[float, float, float, float]) -> bool:
+    return p[0] < q[2] and q[0] < p[2] and p[1] < q[3] and q[1] < p[3]
+
+
+def _pad_hits(route: Route, net: str) -> set[int]:
+    """Indices of foreign-net pads the trace copper overlaps."""
+    hits: set[int] = set()
+    for a, b in zip(route, route[1:]):
+        seg = _segment_box(a, b)
+        for i, (x, y, w, h, pad_net) in enumerate(PADS):
+            pad = (x - w / 2, y - h / 2, x + w / 2, y + h / 2)
+            if pad_net != net and _boxes_overlap(seg, pad):
+                hits.add(i)
+    return hits
+
+
+def _trace_hits(route: Route, others: list[Route]) -> int:
+    """Number of segment pairs whose copper overlaps a foreign trace."""
+    return sum(
+        _boxes_overlap(_segment_box(a0, a1), _segment_box(b0, b1))
+        for a0, a1 in zip(route, route[1:])
+        for other in others
+        for b0, b1 in zip(other, other[1:])
+    )
+
+
+def route_l_shape(nets: list[tuple[Point, Point, str, bool]]) -> list[Route]:
+    """Route each connection as an L-shape, improving on the default.
+
+    Every connection starts from its hand-picked shape.  One pass then
+    considers the other L-shape and takes it only if its copper overlaps
+    no foreign pad the default does not already overlap, and it is
+    strictly better on (foreign pads hit, foreign trace overlaps).
+    Footprints include TRACE_W.
+    """
+    def shape(a: Point, b: Point, vert_first: bool) -> Route:
+        if vert_first:
+            return manhattan_vert_first(*a, *b)
+        return manhattan(*a, *b)
+
+    routes = [shape(a, b, vf) for a, b, _net, vf in nets]
+    for i, (a, b, net, vf) in enumerate(nets):
+        others = [r for j, r in enumerate(routes) if nets[j][2] != net]
+        default, alt = routes[i], shape(a, b, not vf)
+        default_pads, alt_pads = _pad_hits(default, net), _pad_hits(alt, net)
+        if not alt_pads <= default_pads:
+            continue
+        if (len(alt_pads), _trace_hits(alt, others)) < (
+            len(default_pads), _trace_hits(default, others)
+        ):
+            routes[i] = alt
+    return routes
+
+
+def merge_routes(routes: list[Route]) -> list[Route]:
+    """Drop repeated and zero-length segments, then chain what is left.
+
+    Segments are compared in Gerber units so points that print the same
+    are the same.  A segment starting where the previous one ended
+    continues the current path (no new D02 move), and a straight
+    continuation replaces the previous vertex instead of adding one.
+    """
+    def units(pt: Point) -> tuple[int, int]:
+        return (round(pt[0] * SCALE), round(pt[1] * SCALE))
+
+    seen: set[frozenset[tuple[int, int]]] = set()
+    paths: list[Route] = []
+    tails: list[list[tuple[int, int]]] = []  # paths in Gerber units
+    for route in routes:
+        for a, b in zip(route, route[1:]):
+            ua, ub = units(a), units(b)
+            key = frozenset((ua, ub))
+            if ua == ub or key in seen:
+                continue
+            seen.add(key)
+            if paths and tails[-1][-1] == ua:
+                path, tail = paths[-1], tails[-1]
+                u0 = tail[-2]
+                dx0, dy0 = ua[0] - u0[0], ua[1] - u0[1]
+                dx1, dy1 = ub[0] - ua[0], ub[1] - ua[1]
+                if dx0 * dy1 == dy0 * dx1 and dx0 * dx1 + dy0 * dy1 > 0:
+                    path[-1], tail[-1] = b, ub
+                else:
+                    path.append(b)
+                    tail.append(ub)
+            else:
+                paths.append([a, b])
+                tails.append([ua, ub])
+    return paths
+
+
+TRACES: list[Route] = route_l_shape(NETS)
+TRACE_PATHS: list[Route] = merge_routes(TRACES)
 
-# ENA net
-TRACES.append(manhattan_vert_first(*J1_PINS[4], *QFN_BY_PIN[11]))
 
-# RST_N net
-TRACES.append(manhattan_vert_first(*J1_PINS[5], *QFN_BY_PIN[14]))
+# ---------------------------------------------------------------------------
+# Precomputed emission blocks
+# ---------------------------------------------------------------------------
 
-# VIN net
-TRACES.append(manhattan_vert_first(*J1_PINS[6], *QFN_BY_PIN[12]))
+# Copper and soldermask flash the same pad positions with different
+# apertures, so the coordinate-only bodies are built once and shared.
+QFN_VERT_BODY = flash_batch(
+    [(x, y) for x, y, ap, _m, _pin in QFN if ap == AP_QFN_VERT]
+)
+QFN_HORIZ_BODY = flash_batch(
+    [(x, y) for x, y, ap, _m, _pin in QFN if ap == AP_QFN_HORIZ]
+)
+P0402_BODY = flash_batch(P0402_PADS)
+TH_BODY = flash_batch(J1_PINS)
+VIA_BODY = flash_batch(GND_VIAS)
+
+_TRACE_BLOCK = select_aperture(AP_TRACE) + "".join(
+    emit_route(path) for path in TRACE_PATHS
+)
+
+# 0402 silkscreen outlines and the U1 label cross (drawn with AP_SILK)
+_PASSIVE_OUTLINES = "".join(
+    rect_outline(cx - 0.55, cy - 0.35, cx + 0.55, cy + 0.35)
+    for cx, cy in PASSIVE_CENTERS
+)
+U1_LABEL_CROSS = (
+    move_to(IC_X - 0.3, IC_Y + 2.0)
+    + draw_to(IC_X + 0.3, IC_Y + 2.0)
+    + move_to(IC_X, IC_Y + 1.7)
+    + draw_to(IC_X, IC_Y + 2.3)
+)
 
 
 # ---------------------------------------------------------------------------
@@ -291,130 +505,99 @@ TRACES.append(manhattan_vert_first(*J1_PINS[6], *QFN_BY_PIN[12]))
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def gen_top_copper() -> str:
-    out = gerber_header("Copper,L1,Top")
-    out += gerber_apertures([
-        AP_QFN_VERT, AP_QFN_HORIZ, AP_QFN_EP, AP_0402,
-        AP_TH, AP_VIA, AP_TRACE,
-    ])
-    for x, y, ap, _m, _pin in QFN:
-        out += flash(ap, x, y)
-    out += flash(AP_QFN_EP, *EP_POS)
-    for p1, p2 in [(C1_P1, C1_P2), (C2_P1, C2_P2),
-                    (R1_P1, R1_P2), (R2_P1, R2_P2)]:
-        out += flash(AP_0402, *p1)
-        out += flash(AP_0402, *p2)
-    for px, py in J1_PINS:
-        out += flash(AP_TH, px, py)
-    for vx, vy in GND_VIAS:
-        out += flash(AP_VIA, vx, vy)
-    out += select_aperture(AP_TRACE)
-    for route in TRACES:
-        if len(route) < 2:
-            continue
-        out += move_to(*route[0])
-        for pt in route[1:]:
-            out += draw_to(*pt)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Copper,L1,Top"),
+        _APS_TOP_CU,
+        select_aperture(AP_QFN_VERT), QFN_VERT_BODY,
+        select_aperture(AP_QFN_HORIZ), QFN_HORIZ_BODY,
+        flash(AP_QFN_EP, *EP_POS),
+        select_aperture(AP_0402), P0402_BODY,
+        select_aperture(AP_TH), TH_BODY,
+        select_aperture(AP_VIA), VIA_BODY,
+        _TRACE_BLOCK,
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
+@functools.cache
 def gen_bottom_copper() -> str:
-    out = gerber_header("Copper,L2,Bot")
-    out += gerber_apertures([AP_GND_POUR, AP_VIA])
-    out += flash(AP_GND_POUR, BOARD_W / 2, BOARD_H / 2)
-    for vx, vy in GND_VIAS:
-        out += flash(AP_VIA, vx, vy)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Copper,L2,Bot"),
+        _APS_BOT_CU,
+        flash(AP_GND_POUR, BOARD_W / 2, BOARD_H / 2),
+        select_aperture(AP_VIA), VIA_BODY,
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
+@functools.cache
 def gen_top_soldermask() -> str:
-    out = gerber_header("Soldermask,Top")
-    out += gerber_apertures([
-        AP_SMASK_QFN_V, AP_SMASK_QFN_H, AP_SMASK_EP,
-        AP_SMASK_0402, AP_SMASK_TH, AP_SMASK_VIA,
-    ])
-    for x, y, _a, mask_ap, _pin in QFN:
-        out += flash(mask_ap, x, y)
-    out += flash(AP_SMASK_EP, *EP_POS)
-    for p1, p2 in [(C1_P1, C1_P2), (C2_P1, C2_P2),
-                    (R1_P1, R1_P2), (R2_P1, R2_P2)]:
-        out += flash(AP_SMASK_0402, *p1)
-        out += flash(AP_SMASK_0402, *p2)
-    for px, py in J1_PINS:
-        out += flash(AP_SMASK_TH, px, py)
-    for vx, vy in GND_VIAS:
-        out += flash(AP_SMASK_VIA, vx, vy)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Soldermask,Top"),
+        _APS_TOP_MASK,
+        select_aperture(AP_SMASK_QFN_V), QFN_VERT_BODY,
+        select_aperture(AP_SMASK_QFN_H), QFN_HORIZ_BODY,
+        flash(AP_SMASK_EP, *EP_POS),
+        select_aperture(AP_SMASK_0402), P0402_BODY,
+        select_aperture(AP_SMASK_TH), TH_BODY,
+        select_aperture(AP_SMASK_VIA), VIA_BODY,
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
+@functools.cache
 def gen_bottom_soldermask() -> str:
-    out = gerber_header("Soldermask,Bot")
-    out += gerber_apertures([AP_SMASK_VIA, AP_SMASK_TH])
-    for vx, vy in GND_VIAS:
-        out += flash(AP_SMASK_VIA, vx, vy)
-    for px, py in J1_PINS:
-        out += flash(AP_SMASK_TH, px, py)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Soldermask,Bot"),
+        _APS_BOT_MASK,
+        select_aperture(AP_SMASK_VIA), VIA_BODY,
+        select_aperture(AP_SMASK_TH), TH_BODY,
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
+@functools.cache
 def gen_top_silkscreen() -> str:
-    out = gerber_header("Legend,Top")
-    out += gerber_apertures([AP_SILK, AP_PIN1])
     # IC body outline (3x3 mm)
     bx0, by0 = IC_X - 1.5, IC_Y - 1.5
     bx1, by1 = IC_X + 1.5, IC_Y + 1.5
-    out += select_aperture(AP_SILK)
-    out += move_to(bx0, by0)
-    out += draw_to(bx1, by0)
-    out += draw_to(bx1, by1)
-    out += draw_to(bx0, by1)
-    out += draw_to(bx0, by0)
-    # Pin-1 dot
-    out += flash(AP_PIN1, bx0 - 0.4, by0 - 0.4)
-    # 0402 outlines
-    for cx, cy in [C1_CENTER, C2_CENTER, R1_CENTER, R2_CENTER]:
-        out += select_aperture(AP_SILK)
-        out += move_to(cx - 0.55, cy - 0.35)
-        out += draw_to(cx + 0.55, cy - 0.35)
-        out += draw_to(cx + 0.55, cy + 0.35)
-        out += draw_to(cx - 0.55, cy + 0.35)
-        out += draw_to(cx - 0.55, cy - 0.35)
     # Header outline
     hx0 = J1_PINS[0][0] - 1.5
     hx1 = J1_PINS[7][0] + 1.5
     hy0 = J1_Y - 1.5
     hy1 = J1_Y + 1.5
-    out += select_aperture(AP_SILK)
-    out += move_to(hx0, hy0)
-    out += draw_to(hx1, hy0)
-    out += draw_to(hx1, hy1)
-    out += draw_to(hx0, hy1)
-    out += draw_to(hx0, hy0)
-    # U1 label cross
-    out += select_aperture(AP_SILK)
-    out += move_to(IC_X - 0.3, IC_Y + 2.0)
-    out += draw_to(IC_X + 0.3, IC_Y + 2.0)
-    out += move_to(IC_X, IC_Y + 1.7)
-    out += draw_to(IC_X, IC_Y + 2.3)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Legend,Top"),
+        _APS_TOP_SILK,
+        select_aperture(AP_SILK),
+        rect_outline(bx0, by0, bx1, by1),
+        # Pin-1 dot
+        flash(AP_PIN1, bx0 - 0.4, by0 - 0.4),
+        select_aperture(AP_SILK),
+        _PASSIVE_OUTLINES,
+        rect_outline(hx0, hy0, hx1, hy1),
+        U1_LABEL_CROSS,
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
+@functools.cache
 def gen_board_outline() -> str:
-    out = gerber_header("Profile,NP")
-    out += gerber_apertures([AP_OUTLINE])
-    out += select_aperture(AP_OUTLINE)
-    out += move_to(0.0, 0.0)
-    out += draw_to(BOARD_W, 0.0)
-    out += draw_to(BOARD_W, BOARD_H)
-    out += draw_to(0.0, BOARD_H)
-    out += draw_to(0.0, 0.0)
-    out += gerber_footer()
-    return out
+    parts: list[str] = [
+        gerber_header("Profile,NP"),
+        _APS_OUTLINE,
+        select_aperture(AP_OUTLINE),
+        rect_outline(0.0, 0.0, BOARD_W, BOARD_H),
+        gerber_footer(),
+    ]
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -422,6 +605,7 @@ def gen_board_outline() -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def gen_drill() -> str:
     lines: list[str] = [
         "M48",
@@ -462,12 +646,34 @@ FILES = {
 }
 
 
+def write_if_changed(fname: str, data: bytes) -> bool:
+    """Write data to fname unless the file already holds exactly that."""
+    try:
+        with open(fname, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    # Plain ASCII: skip the text I/O layer and hand the bytes to the fd.
+    fd = os.open(fname, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
+
+
 def main() -> None:
-    for fname, generator in FILES.items():
-        content = generator()
-        with open(fname, "w") as f:
-            f.write(content)
-        print(f"wrote {fname}  ({len(content)} bytes)")
+    # The generators are pure and independent, but each takes well under a
+    # millisecond: building them serially beats paying for a process pool.
+    contents = {fname: generator() for fname, generator in FILES.items()}
+    for fname, content in contents.items():
+        if write_if_changed(fname, content.encode("ascii")):
+            print(f"wrote {fname}  ({len(content)} bytes)")
+        else:
+            print(f"unchanged {fname}  ({len(content)} bytes)")
 
     print("\n--- sanity checks ---")
     ok = True
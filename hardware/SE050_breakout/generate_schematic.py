@@ -10,6 +10,7 @@ Output: ../../docs/assets/se050-breakout-schematic.svg
 
 from __future__ import annotations
 
+import functools
 import os
 
 # ---------------------------------------------------------------------------
@@ -74,28 +75,48 @@ VCC_X2 = U1_STUB - 10   # 600
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _attrs_cached(items: tuple[tuple[str, object], ...]) -> str:
+    return " ".join(f'{k.replace("_", "-")}="{v}"' for k, v in items)
+
+
 def _attrs(**kw: object) -> str:
-    parts = []
-    for k, v in kw.items():
-        name = k.replace("_", "-")
-        parts.append(f'{name}="{v}"')
-    return " ".join(parts)
+    # Keyed on insertion order (not sorted) so attribute order in the
+    # output follows the call site.
+    return _attrs_cached(tuple(kw.items()))
+
+
+# %-templates: cheaper than building an f-string per element
+_LINE_TPL = '  <line x1="%s" y1="%s" x2="%s" y2="%s"/>\n'
+_RECT_TPL = '  <rect x="%s" y="%s" width="%s" height="%s" %s/>\n'
+_CIRCLE_TPL = '  <circle cx="%s" cy="%s" r="%s" %s/>\n'
+
+
+@functools.cache
+def _text_tpl(attrs: str) -> str:
+    """Text template with one attribute set baked in."""
+    return '  <text x="%s" y="%s" ' + attrs.replace("%", "%%") + '>%s</text>\n'
 
 
 def line(x1: float, y1: float, x2: float, y2: float) -> str:
-    return f'  <line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}"/>\n'
+    return _LINE_TPL % (x1, y1, x2, y2)
 
 
 def rect(x: float, y: float, w: float, h: float, **kw: object) -> str:
-    return f'  <rect x="{x}" y="{y}" width="{w}" height="{h}" {_attrs(**kw)}/>\n'
+    return _RECT_TPL % (x, y, w, h, _attrs(**kw))
 
 
 def text(x: float, y: float, content: str, **kw: object) -> str:
-    return f'  <text x="{x}" y="{y}" {_attrs(**kw)}>{content}</text>\n'
+    return text_styled(x, y, content, _attrs(**kw))
+
+
+def text_styled(x: float, y: float, content: str, attrs: str) -> str:
+    """Text element with a pre-rendered attribute string."""
+    return _text_tpl(attrs) % (x, y, content)
 
 
 def circle(cx: float, cy: float, r: float, **kw: object) -> str:
-    return f'  <circle cx="{cx}" cy="{cy}" r="{r}" {_attrs(**kw)}/>\n'
+    return _CIRCLE_TPL % (cx, cy, r, _attrs(**kw))
 
 
 def polyline(pts: list[tuple[float, float]]) -> str:
@@ -103,6 +124,11 @@ def polyline(pts: list[tuple[float, float]]) -> str:
     return f'  <polyline points="{s}"/>\n'
 
 
+# Attribute sets shared by every pin label
+_PIN_NAME_ATTRS = _attrs(font_size="11", fill=STROKE, stroke="none")
+_PIN_NUM_ATTRS = _attrs(font_size="10", fill="#999", stroke="none")
+
+
 def junction(x: float, y: float) -> str:
     """Filled dot at wire junction."""
     return circle(x, y, 3.5, fill=STROKE, stroke="none")
@@ -183,73 +209,67 @@ def draw_j1() -> str:
     """J1: 8-pin header connector."""
     y_top = J1_PINS[0][2] - 25
     y_bot = J1_PINS[-1][2] + 25
-    s = ""
-
-    # Body
-    s += rect(J1_BODY_X, y_top, J1_BODY_W, y_bot - y_top,
-              fill="#f8f8f8", stroke=STROKE, stroke_width="2")
-
-    # Component label
-    s += text(J1_BODY_X + J1_BODY_W / 2, y_top - 8, "J1",
-              font_size="14", font_weight="bold",
-              text_anchor="middle", fill=STROKE, stroke="none")
-    s += text(J1_BODY_X + J1_BODY_W / 2, y_top - 22, "8-Pin Header",
-              font_size="10", text_anchor="middle",
-              fill="#999", stroke="none")
+    parts: list[str] = [
+        # Body
+        rect(J1_BODY_X, y_top, J1_BODY_W, y_bot - y_top,
+             fill="#f8f8f8", stroke=STROKE, stroke_width="2"),
+        # Component label
+        text(J1_BODY_X + J1_BODY_W / 2, y_top - 8, "J1",
+             font_size="14", font_weight="bold",
+             text_anchor="middle", fill=STROKE, stroke="none"),
+        text(J1_BODY_X + J1_BODY_W / 2, y_top - 22, "8-Pin Header",
+             font_size="10", text_anchor="middle",
+             fill="#999", stroke="none"),
+    ]
 
     for pin_num, pin_name, y in J1_PINS:
         # Pin label inside body
-        s += text(J1_BODY_X + 10, y + 5,
-                  f"{pin_num}",
-                  font_size="10", fill="#999", stroke="none")
-        s += text(J1_BODY_X + 25, y + 5,
-                  pin_name,
-                  font_size="11", fill=STROKE, stroke="none")
+        parts.append(text_styled(J1_BODY_X + 10, y + 5,
+                                 f"{pin_num}", _PIN_NUM_ATTRS))
+        parts.append(text_styled(J1_BODY_X + 25, y + 5,
+                                 pin_name, _PIN_NAME_ATTRS))
         # Pin circle at body edge
-        s += circle(J1_PIN_X, y, 4,
-                    fill="white", stroke=STROKE, stroke_width="1.5")
+        parts.append(circle(J1_PIN_X, y, 4,
+                            fill="white", stroke=STROKE, stroke_width="1.5"))
         # Stub rightward (skip nc pin)
         if pin_name != "(nc)":
-            s += line(J1_PIN_X + 4, y, J1_STUB, y)
+            parts.append(line(J1_PIN_X + 4, y, J1_STUB, y))
 
-    return s
+    return "".join(parts)
 
 
 def draw_u1() -> str:
     """U1: SE050C1HQ1 (QFN-20)."""
     y_top = U1_PINS[0][2] - 40
     y_bot = U1_PINS[-1][2] + 40
-    s = ""
-
-    # Body
-    s += rect(U1_BODY_X, y_top, U1_BODY_W, y_bot - y_top,
-              fill="#f0f0f0", stroke=STROKE, stroke_width="2")
-
-    # Labels inside body (centered)
     cx = U1_BODY_X + U1_BODY_W / 2
-    s += text(cx, y_top + 22, "U1",
-              font_size="14", font_weight="bold",
-              text_anchor="middle", fill=STROKE, stroke="none")
-    s += text(cx, y_top + 39, "SE050C1HQ1",
-              font_size="11", text_anchor="middle",
-              fill="#666", stroke="none")
-    s += text(cx, y_top + 54, "QFN-20",
-              font_size="10", text_anchor="middle",
-              fill="#999", stroke="none")
+    parts: list[str] = [
+        # Body
+        rect(U1_BODY_X, y_top, U1_BODY_W, y_bot - y_top,
+             fill="#f0f0f0", stroke=STROKE, stroke_width="2"),
+        # Labels inside body (centered)
+        text(cx, y_top + 22, "U1",
+             font_size="14", font_weight="bold",
+             text_anchor="middle", fill=STROKE, stroke="none"),
+        text(cx, y_top + 39, "SE050C1HQ1",
+             font_size="11", text_anchor="middle",
+             fill="#666", stroke="none"),
+        text(cx, y_top + 54, "QFN-20",
+             font_size="10", text_anchor="middle",
+             fill="#999", stroke="none"),
+    ]
 
     for pin_num, pin_name, y in U1_PINS:
         # Stub leftward
-        s += line(U1_BODY_X, y, U1_STUB, y)
+        parts.append(line(U1_BODY_X, y, U1_STUB, y))
         # Pin number near stub end
-        s += text(U1_STUB + 3, y + 4,
-                  str(pin_num),
-                  font_size="10", fill="#999", stroke="none")
+        parts.append(text_styled(U1_STUB + 3, y + 4,
+                                 str(pin_num), _PIN_NUM_ATTRS))
         # Pin name inside body
-        s += text(U1_BODY_X + 30, y + 5,
-                  pin_name,
-                  font_size="11", fill=STROKE, stroke="none")
+        parts.append(text_styled(U1_BODY_X + 30, y + 5,
+                                 pin_name, _PIN_NAME_ATTRS))
 
-    return s
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -258,56 +278,56 @@ def draw_u1() -> str:
 
 
 def draw_wires() -> str:
-    s = ""
-
-    # --- VCC rail ---
-    s += line(VCC_X1, VCC_Y, VCC_X2, VCC_Y)
-    s += vcc_symbol((VCC_X1 + VCC_X2) / 2, VCC_Y)
-
-    # J1.1 VCC → rail
-    s += line(J1_STUB, 110, VCC_X1, 110)
-    s += line(VCC_X1, 110, VCC_X1, VCC_Y)
-    s += junction(VCC_X1, VCC_Y)
-
-    # U1.18 VCC → rail
-    s += line(U1_STUB, 130, VCC_X2, 130)
-    s += line(VCC_X2, 130, VCC_X2, VCC_Y)
-    s += junction(VCC_X2, VCC_Y)
+    parts: list[str] = [
+        # --- VCC rail ---
+        line(VCC_X1, VCC_Y, VCC_X2, VCC_Y),
+        vcc_symbol((VCC_X1 + VCC_X2) / 2, VCC_Y),
+        # J1.1 VCC → rail
+        line(J1_STUB, 110, VCC_X1, 110),
+        line(VCC_X1, 110, VCC_X1, VCC_Y),
+        junction(VCC_X1, VCC_Y),
+        # U1.18 VCC → rail
+        line(U1_STUB, 130, VCC_X2, 130),
+        line(VCC_X2, 130, VCC_X2, VCC_Y),
+        junction(VCC_X2, VCC_Y),
+    ]
 
     # Component tops connect to VCC rail (junctions)
-    for cx in (C1_X, C2_X, R1_X, R2_X):
-        s += junction(cx, VCC_Y)
-
-    # --- GND connections (each gets its own symbol) ---
-    # J1.2
-    s += line(J1_STUB, 175, VCC_X1, 175)
-    s += gnd_symbol(VCC_X1, 175)
-    # C1
-    s += gnd_symbol(C1_X, CAP_BOT)
-    # C2
-    s += gnd_symbol(C2_X, CAP_BOT)
-    # U1.19
-    s += line(U1_STUB, 195, VCC_X2, 195)
-    s += gnd_symbol(VCC_X2, 195)
-
-    # --- SDA net: J1.3 → R1 junction → U1.9 ---
-    s += line(J1_STUB, 260, U1_STUB, 260)
-    s += junction(R1_X, 260)
-
-    # --- SCL net: J1.4 → R2 junction → U1.10 ---
-    s += line(J1_STUB, 330, U1_STUB, 330)
-    s += junction(R2_X, 330)
-
-    # --- ENA: J1.5 → U1.11 ---
-    s += line(J1_STUB, 400, U1_STUB, 400)
-
-    # --- RST_N: J1.6 → U1.14 ---
-    s += line(J1_STUB, 460, U1_STUB, 460)
-
-    # --- VIN: J1.7 → U1.12 ---
-    s += line(J1_STUB, 520, U1_STUB, 520)
-
-    return s
+    parts.extend(junction(cx, VCC_Y) for cx in (C1_X, C2_X, R1_X, R2_X))
+
+    parts += [
+        # --- GND connections (each gets its own symbol) ---
+        # J1.2
+        line(J1_STUB, 175, VCC_X1, 175),
+        gnd_symbol(VCC_X1, 175),
+        # C1
+        gnd_symbol(C1_X, CAP_BOT),
+        # C2
+        gnd_symbol(C2_X, CAP_BOT),
+        # U1.19
+        line(U1_STUB, 195, VCC_X2, 195),
+        gnd_symbol(VCC_X2, 195),
+        # --- SDA net: J1.3 → R1 junction → U1.9 ---
+        line(J1_STUB, 260, U1_STUB, 260),
+        junction(R1_X, 260),
+        # --- SCL net: J1.4 → R2 junction → U1.10 ---
+        line(J1_STUB, 330, U1_STUB, 330),
+        junction(R2_X, 330),
+        # --- ENA: J1.5 → U1.11 ---
+        line(J1_STUB, 400, U1_STUB, 400),
+        # --- RST_N: J1.6 → U1.14 ---
+        line(J1_STUB, 460, U1_STUB, 460),
+        # --- VIN: J1.7 → U1.12 ---
+        line(J1_STUB, 520, U1_STUB, 520),
+    ]
+
+    return "".join(parts)
+
+
+# Nothing in the drawing depends on runtime input, so render it once.
+_WIRES_STATIC = draw_wires()
+_J1_STATIC = draw_j1()
+_U1_STATIC = draw_u1()
 
 
 # ---------------------------------------------------------------------------
@@ -315,8 +335,9 @@ def draw_wires() -> str:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def generate_svg() -> str:
-    svg = f"""\
+    parts: list[str] = [f"""\
 <?xml version="1.0" encoding="UTF-8"?>
 <svg xmlns="http://www.w3.org/2000/svg"
      viewBox="0 0 {W} {H}" width="{W}" height="{H}"
@@ -324,48 +345,45 @@ def generate_svg() -> str:
      stroke="{STROKE}" stroke-width="{STROKE_W}"
      fill="none" stroke-linecap="round" stroke-linejoin="round">
   <rect width="{W}" height="{H}" fill="white" stroke="none"/>
-"""
+"""]
 
     # Wires (behind everything)
-    svg += "\n  <!-- Wires -->\n"
-    svg += draw_wires()
+    parts += ["\n  <!-- Wires -->\n", _WIRES_STATIC]
 
     # Components
-    svg += "\n  <!-- J1 Header -->\n"
-    svg += draw_j1()
-
-    svg += "\n  <!-- U1 SE050 -->\n"
-    svg += draw_u1()
+    parts += ["\n  <!-- J1 Header -->\n", _J1_STATIC]
+    parts += ["\n  <!-- U1 SE050 -->\n", _U1_STATIC]
 
     # Passives
-    svg += "\n  <!-- C1 -->\n"
-    svg += capacitor_v(C1_X, VCC_Y, CAP_BOT, "C1", "100nF")
-
-    svg += "\n  <!-- C2 -->\n"
-    svg += capacitor_v(C2_X, VCC_Y, CAP_BOT, "C2", u"10\u00b5F")
-
-    svg += "\n  <!-- R1 (SDA pull-up) -->\n"
-    svg += resistor_v(R1_X, VCC_Y, R1_BOT, "R1", u"4.7k\u2126")
-
-    svg += "\n  <!-- R2 (SCL pull-up) -->\n"
-    svg += resistor_v(R2_X, VCC_Y, R2_BOT, "R2", u"4.7k\u2126")
+    parts += [
+        "\n  <!-- C1 -->\n",
+        capacitor_v(C1_X, VCC_Y, CAP_BOT, "C1", "100nF"),
+        "\n  <!-- C2 -->\n",
+        capacitor_v(C2_X, VCC_Y, CAP_BOT, "C2", u"10\u00b5F"),
+        "\n  <!-- R1 (SDA pull-up) -->\n",
+        resistor_v(R1_X, VCC_Y, R1_BOT, "R1", u"4.7k\u2126"),
+        "\n  <!-- R2 (SCL pull-up) -->\n",
+        resistor_v(R2_X, VCC_Y, R2_BOT, "R2", u"4.7k\u2126"),
+    ]
 
     # Title & datasheet reference
-    svg += "\n  <!-- Title -->\n"
-    svg += text(W / 2, H - 28,
-                u"SE050 Breakout Board \u2014 Circuit Schematic",
-                font_size="13", text_anchor="middle",
-                fill="#999", stroke="none")
+    parts += [
+        "\n  <!-- Title -->\n",
+        text(W / 2, H - 28,
+             u"SE050 Breakout Board \u2014 Circuit Schematic",
+             font_size="13", text_anchor="middle",
+             fill="#999", stroke="none"),
+    ]
     DS_URL = "https://www.nxp.com/docs/en/data-sheet/SE050-DATASHEET.pdf"
-    svg += (
+    parts.append(
         f'  <a href="{DS_URL}" target="_blank">'
         f'<text x="{W / 2}" y="{H - 10}" font-size="10" '
         f'text-anchor="middle" fill="#07c" stroke="none">'
         f"Datasheet: NXP SE050 (Rev\u00a03.8)</text></a>\n"
     )
 
-    svg += "</svg>\n"
-    return svg
+    parts.append("</svg>\n")
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -380,8 +398,18 @@ def main() -> None:
     os.makedirs(out_dir, exist_ok=True)
     out_path = os.path.join(out_dir, "se050-breakout-schematic.svg")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(svg)
+    data = svg.encode("utf-8")
+    try:
+        with open(out_path, "rb") as f:
+            old = f.read()
+    except FileNotFoundError:
+        old = None
+
+    if old == data:
+        print(f"unchanged {out_path}  ({len(svg)} bytes)")
+        return
+    with open(out_path, "wb") as f:
+        f.write(data)
 
     print(f"wrote {out_path}  ({len(svg)} bytes)")
 